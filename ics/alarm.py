@@ -2,9 +2,8 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import unicode_literals, absolute_import
-from typing import Iterable, Union, Set, Dict, List, Callable, Optional, Type
+from typing import Iterable, Union, Set, Dict, List, Callable, Optional, Tuple, Type
 
-import copy
 from datetime import timedelta, datetime
 
 from .component import Component, Extractor
@@ -66,6 +65,9 @@ class Alarm(Component):
             self.duration = duration
 
         self._unused = Container(name='VALARM')
+        # replaced by _from_container() for parsed components
+        self._classmethod_args = ()
+        self._classmethod_kwargs = {}
 
     @property
     def trigger(self) -> Optional[Union[timedelta, datetime]]:
@@ -131,8 +133,11 @@ class Alarm(Component):
 
         return '<{0}>'.format(value)
 
+    def _key(self) -> Tuple:
+        return (type(self), self._trigger, self._repeat, self._duration)
+
     def __hash__(self) -> int:
-        return hash(repr(self))
+        return hash(self._key())
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
@@ -140,17 +145,18 @@ class Alarm(Component):
     def __eq__(self, other) -> bool:
         """Two alarms are considered equal if they have the same type and base values."""
 
-        return (type(self) is type(other) and
-                self.trigger == other.trigger and
-                self.repeat == other.repeat and
-                self.duration == other.duration)
+        return isinstance(other, Alarm) and self._key() == other._key()
 
     def clone(self):
         """
         Returns:
             Alarm: an exact copy of self"""
-        clone = copy.copy(self)
-        clone._unused = clone._unused.clone()
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        # Component attributes live in slots, out of the instance dict
+        clone._classmethod_args = self._classmethod_args
+        clone._classmethod_kwargs = self._classmethod_kwargs
+        clone._unused = self._unused.clone()
         return clone
 
 
@@ -175,6 +181,8 @@ class AlarmFactory(object):
     @classmethod
     def get_type_from_container(cls, container: Container) -> Type[Alarm]:
         action_type_lines = get_lines(container, 'ACTION')
+        if not action_type_lines:
+            raise ValueError('A VALARM must have an ACTION')
         if len(action_type_lines) > 1:
             raise ValueError('Too many ACTION parameters in VALARM')
 
@@ -187,8 +195,10 @@ class AlarmFactory(object):
 # ------------------
 @Alarm._extracts('TRIGGER', required=True)
 def trigger(alarm: Alarm, line: ContentLine):
-    if not line.params or 'DURATION' in line.params.get('VALUE', ''):
-        alarm.trigger = parse_duration(line.value[1:])
+    # Durations start with a sign or a P, date-times with a digit
+    if line.value[:1] in ('-', '+', 'P'):
+        # Alarm.trigger is the (positive) timespan before the start
+        alarm.trigger = -parse_duration(line.value)
     else:
         if len(line.params) > 1:
             raise ValueError('TRIGGER has too many parameters')
@@ -251,9 +261,10 @@ class DisplayAlarm(Alarm):
     A calendar event VALARM with DISPLAY option.
     """
 
-    # This ensures we copy the existing extractors and outputs from the base class, rather than referencing the array.
-    _EXTRACTORS = copy.copy(Alarm._EXTRACTORS)
-    _OUTPUTS = copy.copy(Alarm._OUTPUTS)
+    # Only the extractors and outputs specific to this class, those of
+    # Alarm are inherited by Component.
+    _EXTRACTORS: List[Extractor] = []
+    _OUTPUTS: List[Callable] = []
 
     def __init__(self,
                  description=None,
@@ -305,9 +316,10 @@ class AudioAlarm(Alarm):
     A calendar event VALARM with AUDIO option.
     """
 
-    # This ensures we copy the existing extractors and outputs from the base class, rather than referencing the array.
-    _EXTRACTORS = copy.copy(Alarm._EXTRACTORS)
-    _OUTPUTS = copy.copy(Alarm._OUTPUTS)
+    # Only the extractors and outputs specific to this class, those of
+    # Alarm are inherited by Component.
+    _EXTRACTORS: List[Extractor] = []
+    _OUTPUTS: List[Callable] = []
 
     def __init__(self,
                  attach=None,
@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 class Attendee(object):
 
+    __slots__ = ('email', 'common_name', 'rsvp')
+
     def __init__(self, email: str, common_name: str = None, rsvp: bool = None) -> None:
         self.email = email
         self.common_name = common_name or email
@@ -22,6 +24,6 @@ class Attendee(object):
             params['CN'] = ["'%s'" % self.common_name]
 
         if self.rsvp:
-            params['RSVP'] = [self.rsvp]
+            params['RSVP'] = ['TRUE']
 
         return params
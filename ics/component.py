@@ -2,11 +2,11 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import unicode_literals, absolute_import
-from typing import List, Dict, Tuple, Any, Callable, Optional, TypeVar
+from typing import List, Dict, Tuple, Any, Callable, Optional, TypeVar, FrozenSet
 import warnings
 from collections import namedtuple
+from functools import lru_cache
 
-from .utils import get_lines
 from .parse import Container, ContentLine
 
 
@@ -20,11 +20,46 @@ ExtractorT = TypeVar('ExtractorT', bound=Callable[[Any, Any], None])
 OutputT = TypeVar('OutputT', bound=Callable[[Any, Container], None]) # FIXME Any should be Self
 
 
+@lru_cache(maxsize=None)
+def _inherited(cls: type, attribute: str) -> Tuple:
+    """Returns the items of the `attribute` lists (_EXTRACTORS or _OUTPUTS)
+    declared by `cls` and its bases, base classes first."""
+    items: List = []
+    for klass in reversed(cls.__mro__):
+        items.extend(klass.__dict__.get(attribute, ()))
+    return tuple(items)
+
+
+@lru_cache(maxsize=None)
+def _required_types(cls: type) -> Tuple[str, ...]:
+    """Returns the line types that a `cls` container must contain."""
+    return tuple(
+        extractor.type for extractor in _inherited(cls, '_EXTRACTORS')
+        if extractor.required and not extractor.default
+    )
+
+
+@lru_cache(maxsize=None)
+def _extracted_types(cls: type) -> FrozenSet[str]:
+    """Returns the line types that are consumed by `cls` extractors."""
+    return frozenset(extractor.type for extractor in _inherited(cls, '_EXTRACTORS'))
+
+
+def _clear_caches() -> None:
+    _inherited.cache_clear()
+    _required_types.cache_clear()
+    _extracted_types.cache_clear()
+
+
 class Component(object):
+    # no instance dict here, so that subclasses can use __slots__
+    __slots__ = ('_unused', '_classmethod_args', '_classmethod_kwargs')
+
     _TYPE = "ABSTRACT"
     _EXTRACTORS: List[Extractor]
     _OUTPUTS: List[Callable]
 
+    _unused: Container
     _classmethod_args: Tuple
     _classmethod_kwargs: Dict
 
@@ -44,34 +79,46 @@ class Component(object):
         if container.name != self._TYPE:
             raise ValueError("container isn't an {}".format(self._TYPE))
 
-        for extractor in self._EXTRACTORS:
-            lines = get_lines(container, extractor.type)
-            if not lines and extractor.required:
-                if extractor.default:
-                    lines = extractor.default
-                    default_str = "\\n".join(map(str, extractor.default))
-                    message = ("The %s property was not found and is required by the RFC." +
-                        " A default value of \"%s\" has been used instead") % (extractor.type, default_str)
-                    warnings.warn(message)
-                else:
-                    raise ValueError(
-                        'A {} must have at least one {}'
-                        .format(container.name, extractor.type))
-
-            if not extractor.multiple and len(lines) > 1:
+        cls = type(self)
+        # group the lines handled by an extractor by type, keep the others
+        index, unused = container._partition(_extracted_types(cls))
+
+        # Fail before running any extractor if required lines are missing
+        missing = [type_ for type_ in _required_types(cls) if type_ not in index]
+        if missing:
+            raise ValueError(
+                'A {} must have at least one {}'
+                .format(container.name, ', '.join(missing)))
+
+        for extractor in _inherited(cls, '_EXTRACTORS'):
+            lines = index.get(extractor.type)
+            if not lines:
+                if not extractor.required:
+                    # Send an empty list or None
+                    extractor.function(self, [] if extractor.multiple else None)
+                    continue
+                # Only required extractors with a default get here
+                lines = extractor.default
+                default_str = "\\n".join(map(str, extractor.default))
+                message = ("The %s property was not found and is required by the RFC." +
+                    " A default value of \"%s\" has been used instead") % (extractor.type, default_str)
+                warnings.warn(message)
+            elif len(lines) > 1:
+                # same (last first) order as get_lines()
+                lines = lines[::-1]
+
+            if extractor.multiple:
+                extractor.function(self, lines)  # Send a list
+            elif len(lines) > 1:
                 raise ValueError(
                     'A {} must have at most one {}'
                     .format(container.name, extractor.type))
-
-            if extractor.multiple:
-                extractor.function(self, lines)  # Send a list or empty list
             else:
-                if len(lines) == 1:
-                    extractor.function(self, lines[0])  # Send the element
-                else:
-                    extractor.function(self, None)  # Send None
+                extractor.function(self, lines[0])  # Send the element
 
-        self._unused = container  # Store unused lines
+        # Store unused lines
+        container[:] = unused
+        self._unused = container
 
     @classmethod
     def _extracts(
@@ -86,17 +133,23 @@ class Component(object):
                 multiple=multiple,
                 default=default)
             cls._EXTRACTORS.append(extractor)
+            _clear_caches()
             return fn
         return decorator
 
     @classmethod
     def _outputs(cls, fn: OutputT) -> OutputT:
         cls._OUTPUTS.append(fn)
+        _clear_caches()
         return fn
 
-    def __str__(self) -> str:
-        """Returns the component in an iCalendar format."""
+    def _to_container(self) -> Container:
+        """Returns the unused lines and the output of every output function."""
         container = self._unused.clone()
-        for output in self._OUTPUTS:
+        for output in _inherited(type(self), '_OUTPUTS'):
             output(self, container)
-        return str(container)
+        return container
+
+    def __str__(self) -> str:
+        """Returns the component in an iCalendar format."""
+        return str(self._to_container())
@@ -28,6 +28,9 @@ from .utils import (
 )
 from .parse import ContentLine, Container
 
+# In the regular expression: Only match unquoted commas.
+CATEGORIES_SEPARATOR_RE = re.compile("(?<!\\\\),")
+
 
 class Event(Component):
 
@@ -100,6 +103,9 @@ class Event(Component):
         self.attendees: Set[Attendee] = set()
         self.categories: Set[str] = set()
         self._unused = Container(name='VEVENT')
+        # replaced by _from_container() for parsed components
+        self._classmethod_args = ()
+        self._classmethod_kwargs = {}
 
         self.name = name
         self.begin = begin
@@ -118,10 +124,10 @@ class Event(Component):
         self.status = status
 
         if categories is not None:
-            self.categories.update(set(categories))
+            self.categories.update(categories)
 
         if attendees is not None:
-            self.attendees.update(set(attendees))
+            self.attendees.update(attendees)
 
     def has_end(self) -> bool:
         """
@@ -448,7 +454,7 @@ class Event(Component):
         """
         Returns:
             int: hash of self. Based on self.uid."""
-        return int(''.join(map(lambda x: '%.3d' % ord(x), self.uid)))
+        return hash(self.uid)
 
 
 # ------------------
@@ -459,14 +465,14 @@ def created(event, line):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = event._classmethod_kwargs['tz']
-        event.created = iso_to_arrow(line, tz_dict)
+        event.created = iso_to_arrow(line, tz_dict, event._classmethod_kwargs.get('timestamps'))
 
 
 @Event._extracts('LAST-MODIFIED')
 def last_modified(event, line):
     if line:
         tz_dict = event._classmethod_kwargs['tz']
-        event.last_modified = iso_to_arrow(line, tz_dict)
+        event.last_modified = iso_to_arrow(line, tz_dict, event._classmethod_kwargs.get('timestamps'))
 
 
 @Event._extracts('DTSTART')
@@ -474,7 +480,7 @@ def start(event, line):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = event._classmethod_kwargs['tz']
-        event.begin = iso_to_arrow(line, tz_dict)
+        event.begin = iso_to_arrow(line, tz_dict, event._classmethod_kwargs.get('timestamps'))
         event._begin_precision = iso_precision(line.value)
 
 
@@ -495,7 +501,7 @@ def end(event, line):
             raise ValueError("An event can't have both DTEND and DURATION")
         # get the dict of vtimezones passed to the classmethod
         tz_dict = event._classmethod_kwargs['tz']
-        event._end_time = iso_to_arrow(line, tz_dict)
+        event._end_time = iso_to_arrow(line, tz_dict, event._classmethod_kwargs.get('timestamps'))
         # one could also save the end_precision to check that if begin_precision is day, end_precision also is
 
 
@@ -540,11 +546,7 @@ def uid(event, line):
 
 @Event._extracts('VALARM', multiple=True)
 def alarms(event, lines):
-    def alarm_factory(x):
-        af = AlarmFactory.get_type_from_container(x)
-        if af is not None:
-            return af._from_container(x)
-    event.alarms = list(map(alarm_factory, lines))
+    event.alarms = [AlarmFactory.get_type_from_container(x)._from_container(x) for x in lines]
 
 
 @Event._extracts('STATUS')
@@ -557,8 +559,7 @@ def status(event, line):
 def categories(event, line):
     event.categories = set()
     if line:
-        # In the regular expression: Only match unquoted commas.
-        for cat in re.split("(?<!\\\\),", line.value):
+        for cat in CATEGORIES_SEPARATOR_RE.split(line.value):
             event.categories.update({unescape_string(cat)})
 
 
@@ -4,10 +4,11 @@
 from __future__ import unicode_literals, absolute_import
 
 from six import StringIO, string_types, text_type
-from typing import Iterable, Union, Set, Dict, List, Callable
+from typing import Iterable, Union, Set, Dict, List, Callable, Tuple
 
 from dateutil.tz import tzical
-import copy
+from datetime import datetime, tzinfo
+from functools import lru_cache
 import collections
 
 from .component import Component, Extractor
@@ -15,12 +16,13 @@ from .timeline import Timeline
 from .event import Event
 from .todo import Todo
 from .parse import (
+    CRLF,
     lines_to_container,
     string_to_container,
     ContentLine,
     Container,
 )
-from .utils import remove_x, remove_sequence
+from .utils import cached_gettz, remove_x, remove_sequence
 from typing import Optional
 
 
@@ -51,9 +53,15 @@ class Calendar(Component):
         # TODO : implement a file-descriptor import and a filename import
 
         self._timezones: Dict = {} # FIXME mypy
-        self.events: Set[Event] = set()
-        self.todos: Set[Todo] = set()
+        self._events: Set[Event] = set()
+        self._todos: Set[Todo] = set()
+        # Imported VEVENT and VTODO containers, parsed on first access
+        self._events_containers: Optional[List[Container]] = None
+        self._todos_containers: Optional[List[Container]] = None
         self._unused = Container(name='VCALENDAR')
+        # replaced by _from_container() for parsed components
+        self._classmethod_args = ()
+        self._classmethod_kwargs = {}
         self.scale = None
         self.method = None
 
@@ -75,9 +83,9 @@ class Calendar(Component):
             self._populate(container[0])  # Use first calendar
         else:
             if events is not None:
-                self.events.update(set(events))
+                self.events.update(events)
             if todos is not None:
-                self.todos.update(set(todos))
+                self.todos.update(todos)
             self._creator = creator
 
     def __repr__(self) -> str:
@@ -90,7 +98,7 @@ class Calendar(Component):
     def __iter__(self) -> Iterable[str]:
         """Returns:
         iterable: an iterable version of __str__, line per line
-        (with line-endings).
+        (with CRLF line-endings).
 
         Example:
             Can be used to write calendar to a file:
@@ -98,9 +106,8 @@ class Calendar(Component):
             >>> c = Calendar(); c.events.add(Event(name="My cool event"))
             >>> open('my.ics', 'w').writelines(c)
         """
-        for line in str(self).split('\n'):
-            l = line + '\n'
-            yield l
+        for line in self._to_container()._lines():
+            yield line + CRLF
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Calendar):
@@ -114,6 +121,62 @@ class Calendar(Component):
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    @property
+    def events(self) -> Set[Event]:
+        """Get or set the calendar's events.
+
+        |  Will return a set of :class:`ics.event.Event`.
+        |  May be set to a set of :class:`ics.event.Event`.
+        |  Imported events are only parsed on first access.
+        """
+        if self._events_containers is not None:
+            # tz=self._timezones gives access to the event factory to the
+            # timezones list
+            # parsing strips the extracted lines from the containers, which
+            # may be shared with copies of this calendar: parse clones
+            timestamps: Dict[Tuple[str, str], datetime] = {}  # see iso_to_arrow()
+            self._events = set()
+            for x in self._events_containers:
+                event = Event._from_container(x.clone(), tz=self._timezones, timestamps=timestamps)
+                # only needed while parsing, don't keep it alive with the event
+                del event._classmethod_kwargs['timestamps']
+                self._events.add(event)
+            self._events_containers = None
+        return self._events
+
+    @events.setter
+    def events(self, value: Set[Event]) -> None:
+        self._events_containers = None
+        self._events = value
+
+    @property
+    def todos(self) -> Set[Todo]:
+        """Get or set the calendar's todos.
+
+        |  Will return a set of :class:`ics.todo.Todo`.
+        |  May be set to a set of :class:`ics.todo.Todo`.
+        |  Imported todos are only parsed on first access.
+        """
+        if self._todos_containers is not None:
+            # tz=self._timezones gives access to the todo factory to the
+            # timezones list
+            # parsing strips the extracted lines from the containers, which
+            # may be shared with copies of this calendar: parse clones
+            timestamps: Dict[Tuple[str, str], datetime] = {}  # see iso_to_arrow()
+            self._todos = set()
+            for x in self._todos_containers:
+                todo = Todo._from_container(x.clone(), tz=self._timezones, timestamps=timestamps)
+                # only needed while parsing, don't keep it alive with the todo
+                del todo._classmethod_kwargs['timestamps']
+                self._todos.add(todo)
+            self._todos_containers = None
+        return self._todos
+
+    @todos.setter
+    def todos(self, value: Set[Todo]) -> None:
+        self._todos_containers = None
+        self._todos = value
+
     @property
     def creator(self) -> Optional[str]:
         """Get or set the calendar's creator.
@@ -136,11 +199,16 @@ class Calendar(Component):
         Returns:
             Calendar: an exact deep copy of self
         """
-        clone = copy.copy(self)
-        clone._unused = clone._unused.clone()
-        clone.events = copy.copy(self.events)
-        clone.todos = copy.copy(self.todos)
-        clone._timezones = copy.copy(self._timezones)
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        # Component attributes live in slots, out of the instance dict
+        clone._classmethod_args = self._classmethod_args
+        clone._classmethod_kwargs = self._classmethod_kwargs
+        clone._unused = self._unused.clone()
+        clone.events = self.events.copy()
+        clone.todos = self.todos.copy()
+        clone._timezones = self._timezones.copy()
+        clone.timeline = Timeline(clone)
         return clone
 
 
@@ -188,6 +256,21 @@ def method(calendar, line):
         calendar.method_params = {}
 
 
+@lru_cache(maxsize=128)
+def _parse_vtimezone(block: str) -> Dict[str, tzinfo]:
+    """Parses a serialized VTIMEZONE block with tzical.
+
+    Results are cached so that calendars sharing the same VTIMEZONE
+    definitions only pay for tzical once.
+    """
+    fake_file = StringIO()
+    fake_file.write(block)
+    fake_file.seek(0)
+    timezones = tzical(fake_file)  # tzical does not like strings
+    # timezones is a tzical object and could contain multiple timezones
+    return {key: timezones.get(key) for key in timezones.keys()}
+
+
 @Calendar._extracts('VTIMEZONE', multiple=True)
 def timezone(calendar, vtimezones):
     """Receives a list of VTIMEZONE blocks.
@@ -195,33 +278,31 @@ def timezone(calendar, vtimezones):
     Parses them and adds them to calendar._timezones.
     """
     for vtimezone in vtimezones:
+        tzid = next((line.value for line in vtimezone if line.name == 'TZID'), None)
+        # iso_to_arrow() uses cached_gettz() before looking at calendar._timezones,
+        # so there is no point in parsing the blocks it knows about
+        tz = cached_gettz(tzid) if tzid else None
+        if tz:
+            calendar._timezones[tzid] = tz
+            continue
+
         remove_x(vtimezone)  # Remove non standard lines from the block
         remove_sequence(vtimezone)  # Remove SEQUENCE lines because tzical does not understand them
-        fake_file = StringIO()
-        fake_file.write(str(vtimezone))  # Represent the block as a string
-        fake_file.seek(0)
-        timezones = tzical(fake_file)  # tzical does not like strings
-        # timezones is a tzical object and could contain multiple timezones
-        for key in timezones.keys():
-            calendar._timezones[key] = timezones.get(key)
+        calendar._timezones.update(_parse_vtimezone(str(vtimezone)))
 
 
 @Calendar._extracts('VEVENT', multiple=True)
 def events(calendar, lines):
-    # tz=calendar._timezones gives access to the event factory to the
-    # timezones list
-    def event_factory(x):
-        return Event._from_container(x, tz=calendar._timezones)
-    calendar.events = set(map(event_factory, lines))
+    # VEVENTs are only parsed when calendar.events is first accessed
+    calendar._events = set()
+    calendar._events_containers = lines
 
 
 @Calendar._extracts('VTODO', multiple=True)
 def todos(calendar, lines):
-    # tz=calendar._timezones gives access to the event factory to the
-    # timezones list
-    def todo_factory(x):
-        return Todo._from_container(x, tz=calendar._timezones)
-    calendar.todos = set(map(todo_factory, lines))
+    # VTODOs are only parsed when calendar.todos is first accessed
+    calendar._todos = set()
+    calendar._todos_containers = lines
 
 
 # -------------------
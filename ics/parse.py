@@ -4,9 +4,14 @@
 from __future__ import unicode_literals, absolute_import
 
 import collections
+import sys
+from typing import DefaultDict
 
 CRLF = '\r\n'
 
+# parameters whose values come from a small set, worth interning
+INTERNED_PARAM_VALUES = frozenset(('TZID', 'VALUE'))
+
 
 class ParseError(Exception):
     pass
@@ -21,6 +26,8 @@ class ContentLine:
     value:  its value
     """
 
+    __slots__ = ('name', 'params', 'value')
+
     def __eq__(self, other):
         ret = (self.name == other.name and
                self.params == other.params and
@@ -31,7 +38,8 @@ class ContentLine:
         return not self.__eq__(other)
 
     def __init__(self, name, params={}, value=''):
-        self.name = name.upper()
+        # names come from a small vocabulary repeated on every component
+        self.name = sys.intern(name.upper())
         self.params = params
         self.value = value
 
@@ -75,7 +83,14 @@ class ContentLine:
             if '=' not in paramstr:
                 raise ParseError("No '=' in line '{}'".format(paramstr))
             pname, pvals = paramstr.split('=', 1)
-            params[pname] = pvals.split(',')
+            # parameter names repeat a lot too, and so do the values of
+            # VALUE and TZID. Other values (CN, ALTREP...) are free-form:
+            # interned strings are never freed, so they are left alone.
+            pname = sys.intern(pname)
+            if pname in INTERNED_PARAM_VALUES:
+                params[pname] = [sys.intern(pval) for pval in pvals.split(',')]
+            else:
+                params[pname] = pvals.split(',')
         return cls(name, params, value)
 
     def clone(self):
@@ -102,10 +117,43 @@ class Container(list):
         ret.append('END:' + name)
         return CRLF.join(ret)
 
+    def _lines(self):
+        """ yields the lines of the container in iCalendar format, one by
+        one and without line endings.
+        """
+        yield 'BEGIN:' + self.name
+        for item in self:
+            if isinstance(item, Container):
+                yield from item._lines()
+            elif isinstance(item, str):
+                # already serialized components
+                yield from item.split(CRLF)
+            else:
+                yield str(item)
+        yield 'END:' + self.name
+
     def __repr__(self):
         return "<Container '{}' with {} element{}>" \
             .format(self.name, len(self), "s" if len(self) > 1 else "")
 
+    def _partition(self, names):
+        """ splits the container in a single pass: returns a dict mapping
+        each of `names` found in the container to the list of ContentLines
+        and Containers with that name, and the list of all the other items.
+        Both keep the order of the container.
+
+        The result is not cached, as the container may be modified
+        afterwards.
+        """
+        index: DefaultDict[str, list] = collections.defaultdict(list)
+        rest: list = []
+        for item in self:
+            if item.name in names:
+                index[item.name].append(item)
+            else:
+                rest.append(item)
+        return index, rest
+
     @classmethod
     def parse(cls, name, tokenized_lines):
         items = []
@@ -2,13 +2,10 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import unicode_literals, absolute_import
-from typing import Iterable, Union, Set, Dict, List, Callable, Optional
-
-
-from six.moves import map
+from typing import Any, Iterable, Union, Set, Dict, List, Callable, Optional, Tuple
 
 import arrow
-import copy
+import operator
 from datetime import timedelta, datetime
 
 from .alarm import AlarmFactory, Alarm
@@ -26,6 +23,11 @@ from .utils import (
 from .parse import ContentLine, Container
 
 
+STATUS_VALUES = (None, 'NEEDS-ACTION', 'COMPLETED', 'IN-PROCESS', 'CANCELLED')
+STATUSES = frozenset(STATUS_VALUES)
+STATUS_ERROR = 'status must be one of %s' % ", ".join([repr(x) for x in STATUS_VALUES])
+
+
 class Todo(Component):
 
     """A todo list entry.
@@ -38,6 +40,14 @@ class Todo(Component):
     _EXTRACTORS: List[Extractor] = []
     _OUTPUTS: List[Callable] = []
 
+    __slots__ = (
+        '_percent', '_priority', '_begin', '_due_time', '_duration', '_status',
+        '_due_cache',
+        'uid', 'dtstamp', 'completed', 'created', 'description', 'location',
+        'name', 'url', 'alarms',
+        '__weakref__',
+    )
+
     def __init__(self,
                  dtstamp=None,
                  uid: str = None,
@@ -82,9 +92,13 @@ class Todo(Component):
         self._begin = None
         self._due_time = None
         self._duration = None
+        self._due_cache = None  # computed due, reset when begin, due or duration change
+        # replaced by _from_container() for parsed todos, always set for clone()
+        self._classmethod_args = ()
+        self._classmethod_kwargs = {}
 
         self.uid = uid_gen() if not uid else uid
-        self.dtstamp = arrow.now() if not dtstamp else get_arrow(dtstamp)
+        self.dtstamp = arrow.utcnow() if not dtstamp else get_arrow(dtstamp)
         self.completed = get_arrow(completed)
         self.created = get_arrow(created)
         self.description = description
@@ -155,6 +169,7 @@ class Todo(Component):
         if value and self._due_time and value > self._due_time:
             raise ValueError('Begin must be before due time')
         self._begin = value
+        self._due_cache = None
 
     @property
     def due(self):
@@ -169,14 +184,14 @@ class Todo(Component):
         |  Must not be set to an inferior value than self.begin.
         """
 
-        if self._duration:
-            # if due is duration defined return the beginning + duration
-            return self.begin + self._duration
-        elif self._due_time:
-            # if due is time defined
-            return self._due_time
-        else:
-            return None
+        if self._due_cache is None:
+            if self._duration:
+                # if due is duration defined return the beginning + duration
+                self._due_cache = self.begin + self._duration
+            else:
+                # if due is time defined (or None)
+                self._due_cache = self._due_time
+        return self._due_cache
 
     @due.setter
     def due(self, value):
@@ -185,6 +200,7 @@ class Todo(Component):
             raise ValueError('Due must be after begin')
 
         self._due_time = value
+        self._due_cache = None
 
         if value:
             self._duration = None
@@ -217,6 +233,7 @@ class Todo(Component):
             value = timedelta(value)
 
         self._duration = value
+        self._due_cache = None
 
         if value:
             self._due_time = None
@@ -229,9 +246,8 @@ class Todo(Component):
     def status(self, value: Optional[str]):
         if isinstance(value, str):
             value = value.upper()
-        statuses = (None, 'NEEDS-ACTION', 'COMPLETED', 'IN-PROCESS', 'CANCELLED')
-        if value not in statuses:
-            raise ValueError('status must be one of %s' % ", ".join([repr(x) for x in statuses]))
+        if value not in STATUSES:
+            raise ValueError(STATUS_ERROR)
         self._status = value
 
     def __repr__(self) -> str:
@@ -245,77 +261,31 @@ class Todo(Component):
             return "<Todo '{}' due:{}>".format(self.name, self.due)
         return "<Todo '{}' begin:{} due:{}>".format(self.name, self.begin, self.due)
 
-    def __lt__(self, other) -> bool:
+    def _sort_key(self) -> Tuple:
+        # todos without a name come first
+        return (self.due, self.name is not None, self.name or '')
+
+    def _compare(self, other, op: Callable[[Any, Any], bool]) -> bool:
         if isinstance(other, Todo):
-            if self.due is None and other.due is None:
-                if self.name is None and other.name is None:
-                    return False
-                elif self.name is None:
-                    return True
-                elif other.name is None:
-                    return False
-                else:
-                    return self.name < other.name
-            return self.due < other.due
+            return op(self._sort_key(), other._sort_key())
         if isinstance(other, datetime):
-            if self.due:
-                return self.due < other
+            due = self.due
+            if due:
+                return op(due, other)
         raise NotImplementedError(
             'Cannot compare Todo and {}'.format(type(other)))
 
+    def __lt__(self, other) -> bool:
+        return self._compare(other, operator.lt)
+
     def __le__(self, other) -> bool:
-        if isinstance(other, Todo):
-            if self.due is None and other.due is None:
-                if self.name is None and other.name is None:
-                    return True
-                elif self.name is None:
-                    return True
-                elif other.name is None:
-                    return False
-                else:
-                    return self.name <= other.name
-            return self.due <= other.due
-        if isinstance(other, datetime):
-            if self.due:
-                return self.due <= other
-        raise NotImplementedError(
-            'Cannot compare Todo and {}'.format(type(other)))
+        return self._compare(other, operator.le)
 
     def __gt__(self, other) -> bool:
-        if isinstance(other, Todo):
-            if self.due is None and other.due is None:
-                if self.name is None and other.name is None:
-                    return False
-                elif self.name is None:
-                    return False
-                elif other.name is None:
-                    return True
-                else:
-                    return self.name > other.name
-            return self.due > other.due
-        if isinstance(other, datetime):
-            if self.due:
-                return self.due > other
-        raise NotImplementedError(
-            'Cannot compare Todo and {}'.format(type(other)))
+        return self._compare(other, operator.gt)
 
     def __ge__(self, other) -> bool:
-        if isinstance(other, Todo):
-            if self.due is None and other.due is None:
-                if self.name is None and other.name is None:
-                    return True
-                elif self.name is None:
-                    return True
-                elif other.name is None:
-                    return False
-                else:
-                    return self.name >= other.name
-            return self.due >= other.due
-        if isinstance(other, datetime):
-            if self.due:
-                return self.due >= other
-        raise NotImplementedError(
-            'Cannot compare Todo and {}'.format(type(other)))
+        return self._compare(other, operator.ge)
 
     def __eq__(self, other) -> bool:
         """Two todos are considered equal if they have the same uid."""
@@ -335,16 +305,27 @@ class Todo(Component):
         """
         Returns:
             Todo: an exact copy of self"""
-        clone = copy.copy(self)
-        clone._unused = clone._unused.clone()
-        clone.alarms = copy.copy(self.alarms)
+        clone = object.__new__(type(self))
+        for attribute, value in zip(TODO_ATTRIBUTES, get_todo_attributes(self)):
+            setattr(clone, attribute, value)
+        if hasattr(self, '__dict__'):  # subclasses without __slots__
+            clone.__dict__.update(self.__dict__)
+        clone._unused = self._unused.clone()
+        clone.alarms = list(self.alarms)
         return clone
 
-    def __hash__(self):
+    def __hash__(self) -> int:
         """
         Returns:
             int: hash of self. Based on self.uid."""
-        return int(''.join(map(lambda x: '%.3d' % ord(x), self.uid)))
+        return hash(self.uid)
+
+
+# the slots set by Todo.__init__, copied by Todo.clone()
+TODO_ATTRIBUTES = tuple(
+    name for name in Component.__slots__ + Todo.__slots__ if name != '__weakref__'
+)
+get_todo_attributes = operator.attrgetter(*TODO_ATTRIBUTES)
 
 
 # ------------------
@@ -355,7 +336,7 @@ def dtstamp(todo: Todo, line: ContentLine):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = todo._classmethod_kwargs['tz']
-        todo.dtstamp = iso_to_arrow(line, tz_dict)
+        todo.dtstamp = iso_to_arrow(line, tz_dict, todo._classmethod_kwargs.get('timestamps'))
 
 
 # TODO : add option somewhere to ignore some errors
@@ -370,7 +351,7 @@ def completed(todo: Todo, line: ContentLine):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = todo._classmethod_kwargs['tz']
-        todo.completed = iso_to_arrow(line, tz_dict)
+        todo.completed = iso_to_arrow(line, tz_dict, todo._classmethod_kwargs.get('timestamps'))
 
 
 @Todo._extracts('CREATED')
@@ -378,7 +359,7 @@ def created(todo: Todo, line: ContentLine):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = todo._classmethod_kwargs['tz']
-        todo.created = iso_to_arrow(line, tz_dict)
+        todo.created = iso_to_arrow(line, tz_dict, todo._classmethod_kwargs.get('timestamps'))
 
 
 @Todo._extracts('DESCRIPTION')
@@ -391,7 +372,7 @@ def start(todo: Todo, line: ContentLine):
     if line:
         # get the dict of vtimezones passed to the classmethod
         tz_dict = todo._classmethod_kwargs['tz']
-        todo.begin = iso_to_arrow(line, tz_dict)
+        todo.begin = iso_to_arrow(line, tz_dict, todo._classmethod_kwargs.get('timestamps'))
 
 
 @Todo._extracts('LOCATION')
@@ -427,7 +408,8 @@ def due(todo: Todo, line: ContentLine):
             raise ValueError("A todo can't have both DUE and DURATION")
         # get the dict of vtimezones passed to the classmethod
         tz_dict = todo._classmethod_kwargs['tz']
-        todo._due_time = iso_to_arrow(line, tz_dict)
+        todo._due_time = iso_to_arrow(line, tz_dict, todo._classmethod_kwargs.get('timestamps'))
+        todo._due_cache = None
 
 
 @Todo._extracts('DURATION')
@@ -437,15 +419,12 @@ def duration(todo: Todo, line: ContentLine):
         if todo._due_time:  # pragma: no cover
             raise ValueError("An todo can't have both DUE and DURATION")
         todo._duration = parse_duration(line.value)
+        todo._due_cache = None
 
 
 @Todo._extracts('VALARM', multiple=True)
-def alarms(todo: Todo, lines: List[ContentLine]):
-    def alarm_factory(x):
-        af = AlarmFactory.get_type_from_container(x)
-        return af._from_container(x)
-
-    todo.alarms = list(map(alarm_factory, lines))
+def alarms(todo: Todo, lines: List[Container]):
+    todo.alarms = [AlarmFactory.get_type_from_container(x)._from_container(x) for x in lines]
 
 
 @Todo._extracts('STATUS')
@@ -462,7 +441,7 @@ def o_dtstamp(todo: Todo, container: Container):
     if todo.dtstamp:
         instant = todo.dtstamp
     else:
-        instant = arrow.now()
+        instant = arrow.utcnow()
 
     container.append(ContentLine('DTSTAMP',
                                  value=arrow_to_iso(instant)))
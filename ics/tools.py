@@ -1,9 +1,10 @@
 import re
 
+HTML_TAG_RE = re.compile(r'<.*?>')
+
 
 def striphtml(data):
-    p = re.compile(r'<.*?>')
-    return p.sub('', data)
+    return HTML_TAG_RE.sub('', data)
 
 
 def validate(string):
@@ -4,7 +4,8 @@
 from __future__ import unicode_literals, absolute_import
 
 from arrow.arrow import Arrow
-from datetime import timedelta
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 
 from uuid import uuid4
 from dateutil.tz import gettz
@@ -15,21 +16,20 @@ from .parse import Container, ContentLine
 
 from . import parse
 
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None  # type: ignore
+
 tzutc = arrow.utcnow().tzinfo
 
 
 def remove_x(container: Container) -> None:
-    for i in reversed(range(len(container))):
-        item = container[i]
-        if item.name.startswith('X-'):
-            del container[i]
+    container[:] = [item for item in container if not item.name.startswith('X-')]
 
 
 def remove_sequence(container: Container) -> None:
-    for i in reversed(range(len(container))):
-        item = container[i]
-        if item.name == 'SEQUENCE':
-            del container[i]
+    container[:] = [item for item in container if item.name != 'SEQUENCE']
 
 
 DATE_FORMATS: Dict[int, str] = dict((len(k), k) for k in (
@@ -39,10 +39,35 @@ DATE_FORMATS: Dict[int, str] = dict((len(k), k) for k in (
     'YYYYMMDDTHHmm',
     'YYYYMMDDTHHmmss'))
 
+# matches all the DATE_FORMATS above
+COMPACT_DATE_RE = re.compile(
+    r'(\d{4})(\d{2})(?:(\d{2})(?:T(\d{2})(?:(\d{2})(\d{2})?)?)?)?')
+
+
+def ciso8601_get(string: str) -> Optional[Arrow]:
+    '''parses `string` with the ciso8601 C extension if it is installed.
+    Returns None if it is not or if it can't handle `string`, in which
+    case the caller should fall back to arrow.'''
+    if ciso8601 is None:
+        return None
+    try:
+        return Arrow.fromdatetime(ciso8601.parse_datetime(string))
+    except ValueError:
+        return None
+
 
 def arrow_get(string: str) -> Arrow:
     '''this function exists because ICS uses ISO 8601 without dashes or
     colons, i.e. not ISO 8601 at all.'''
+    return Arrow.fromdatetime(parse_datetime(string))
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(string: str) -> datetime:
+    '''the memoized part of arrow_get(): calendars repeat the same
+    timestamps a lot. It returns datetime objects, which are immutable,
+    unlike Arrow objects (their tzinfo can be set), so that every caller
+    gets its own Arrow.'''
 
     # replace slashes with dashes
     if '/' in string:
@@ -50,13 +75,34 @@ def arrow_get(string: str) -> Arrow:
 
     # if string contains dashes, assume it to be proper ISO 8601
     if '-' in string:
-        return arrow.get(string)
+        return (ciso8601_get(string) or arrow.get(string)).datetime
 
     string = string.rstrip('Z')
-    return arrow.get(string, DATE_FORMATS[len(string)])
-
-
-def iso_to_arrow(time_container: Optional[ContentLine], available_tz={}) -> Arrow:
+    match = COMPACT_DATE_RE.fullmatch(string)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day or 1),
+                int(hour or 0), int(minute or 0), int(second or 0))
+        except ValueError:
+            pass  # out of range values, let arrow report them
+    return arrow.get(string, DATE_FORMATS[len(string)]).datetime
+
+
+@lru_cache(maxsize=128)
+def cached_gettz(name: str) -> Optional[tzinfo]:
+    '''dateutil's gettz() caches the timezones it finds, but not the misses:
+    unknown names (e.g. Outlook's "W. Europe Standard Time") are looked up
+    on the filesystem again on every call.'''
+    return gettz(name)
+
+
+def iso_to_arrow(time_container: Optional[ContentLine], available_tz={},
+                 cache: Optional[Dict[Tuple[str, str], datetime]] = None) -> Arrow:
+    '''`cache` is an optional dict, shared by the events (or by the todos)
+    of a calendar while they are parsed, remembering the times bound to its
+    VTIMEZONEs as datetime objects.'''
     if time_container is None:
         return None
 
@@ -75,11 +121,19 @@ def iso_to_arrow(time_container: Optional[ContentLine], available_tz={}) -> Arro
         val = time_container.value
 
     if tz and not (val[-1].upper() == 'Z'):
-        naive = arrow_get(val).naive
-        selected_tz = gettz(tz)
-        if not selected_tz:
-            selected_tz = available_tz.get(tz, 'UTC')
-        return arrow.get(naive, selected_tz)
+        if cached_gettz(tz):
+            return Arrow.fromdatetime(_localized_datetime(val, tz))
+        # the timezone comes from a VTIMEZONE of this very calendar, it
+        # can't be shared with other calendars through the global cache
+        key = (val, tz)
+        local = cache.get(key) if cache is not None else None
+        if local is None:
+            naive = parse_datetime(val).replace(tzinfo=None)
+            local = arrow.get(naive, available_tz.get(tz, 'UTC')).datetime
+            if cache is not None:
+                cache[key] = local
+        # a new Arrow for every line, see parse_datetime()
+        return Arrow.fromdatetime(local)
     else:
         return arrow_get(val)
 
@@ -87,12 +141,22 @@ def iso_to_arrow(time_container: Optional[ContentLine], available_tz={}) -> Arro
     # http://www.kanzaki.com/docs/ical/dateTime.html)
 
 
+@lru_cache(maxsize=4096)
+def _localized_datetime(value: str, tzid: str) -> datetime:
+    '''parses `value` as a local time of the system timezone `tzid`'''
+    return parse_datetime(value).replace(tzinfo=cached_gettz(tzid))
+
+
+# separates a time from its UTC offset
+UTC_OFFSET_SIGN_RE = re.compile('[+-]')
+
+
 def iso_precision(string: str) -> str:
     has_time = 'T' in string
 
     if has_time:
         date_string, time_string = string.split('T', 1)
-        time_parts = re.split('[+-]', time_string, 1)
+        time_parts = UTC_OFFSET_SIGN_RE.split(time_string, 1)
         has_seconds = time_parts[0].count(':') > 1
         has_seconds = not has_seconds and len(time_parts[0]) == 6
 
@@ -105,21 +169,54 @@ def iso_precision(string: str) -> str:
 
 
 def get_lines(container: Container, name: str) -> List[ContentLine]:
-    lines = []
-    for i in reversed(range(len(container))):
-        item = container[i]
+    """Removes the lines named `name` from `container` and returns them,
+    last one first."""
+    lines: List[ContentLine] = []
+    rest: List[ContentLine] = []
+    for item in container:
         if item.name == name:
             lines.append(item)
-            del container[i]
+        else:
+            rest.append(item)
+    container[:] = rest
+    lines.reverse()
     return lines
 
 
+# DURATION designators and their value as (days, seconds)
+DURATION_UNITS: Dict[str, Tuple[int, int]] = {
+    'W': (7, 0), 'D': (1, 0),
+    'H': (0, 3600), 'M': (0, 60), 'S': (0, 1),
+}
+
+
+# a DURATION value as specified by RFC 5545, units in their canonical order
+DURATION_RE = re.compile(
+    r'([-+])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+
+@lru_cache(maxsize=256)
 def parse_duration(line: str) -> timedelta:
     """
     Return a timedelta object from a string in the DURATION property format
     """
-    DAYS, SECS = {'D': 1, 'W': 7}, {'S': 1, 'M': 60, 'H': 3600}
-    sign, i = 1, 0
+    match = DURATION_RE.fullmatch(line)
+    if match is None:
+        return parse_unordered_duration(line)
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    total_days = int(weeks or 0) * 7 + int(days or 0)
+    total_secs = int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0)
+    if sign == '-':
+        return timedelta(-total_days, -total_secs)
+    return timedelta(total_days, total_secs)
+
+
+def parse_unordered_duration(line: str) -> timedelta:
+    """
+    Same as parse_duration, but also accepts units in any order and
+    time units without the T separator, as found in the wild
+    """
+    sign, i, end = 1, 0, len(line)
     if line[i] in '-+':
         if line[i] == '-':
             sign = -1
@@ -128,101 +225,119 @@ def parse_duration(line: str) -> timedelta:
         raise parse.ParseError()
     i += 1
     days, secs = 0, 0
-    while i < len(line):
+    seen = ''
+    while i < end:
         if line[i] == 'T':
             i += 1
-            if i == len(line):
+            if i == end:
                 break
         j = i
-        while line[j].isdigit():
+        while j < end and line[j].isdigit():
             j += 1
-        if i == j:
+        if i == j or j == end:
             raise parse.ParseError()
-        val = int(line[i:j])
-        if line[j] in DAYS:
-            days += val * DAYS[line[j]]
-            DAYS.pop(line[j])
-        elif line[j] in SECS:
-            secs += val * SECS[line[j]]
-            SECS.pop(line[j])
-        else:
+        unit = line[j]
+        if unit in seen or unit not in DURATION_UNITS:
             raise parse.ParseError()
+        seen += unit
+        unit_days, unit_secs = DURATION_UNITS[unit]
+        val = int(line[i:j])
+        days += val * unit_days
+        secs += val * unit_secs
         i = j + 1
     return timedelta(sign * days, sign * secs)
 
 
+ZERO_DURATION = timedelta(0)
+
+
+@lru_cache(maxsize=256)
 def timedelta_to_duration(dt: timedelta) -> str:
     """
     Return a string according to the DURATION property format
     from a timedelta object
     """
-    days, secs = dt.days, dt.seconds
-    res = 'P'
-    if days // 7:
-        res += str(days // 7) + 'W'
-        days %= 7
+    parts = ['P']
+    if dt < ZERO_DURATION:
+        parts, dt = ['-P'], -dt
+    weeks, days = divmod(dt.days, 7)
+    hours, secs = divmod(dt.seconds, 3600)
+    minutes, secs = divmod(secs, 60)
+    if weeks:
+        parts += (str(weeks), 'W')
     if days:
-        res += str(days) + 'D'
-    if secs:
-        res += 'T'
-        if secs // 3600:
-            res += str(secs // 3600) + 'H'
-            secs %= 3600
-        if secs // 60:
-            res += str(secs // 60) + 'M'
-            secs %= 60
+        parts += (str(days), 'D')
+    if hours or minutes or secs:
+        parts.append('T')
+        if hours:
+            parts += (str(hours), 'H')
+        if minutes:
+            parts += (str(minutes), 'M')
         if secs:
-            res += str(secs) + 'S'
-    return res
+            parts += (str(secs), 'S')
+    return ''.join(parts)
 
 
 def get_arrow(value: Union[None, Arrow, Tuple, Dict]) -> Arrow:
-    if value is None:
-        return None
+    # exact type check first: setters mostly receive Arrow objects (or None)
+    if value is None or type(value) is Arrow:
+        return value
     elif isinstance(value, Arrow):
         return value
     elif isinstance(value, tuple):
         return arrow.get(*value)
     elif isinstance(value, dict):
         return arrow.get(**value)
+    elif isinstance(value, str) and '-' in value:
+        # only dashed strings: arrow reads bare digits as a timestamp
+        return ciso8601_get(value) or arrow.get(value)
     else:
         return arrow.get(value)
 
 
 def arrow_to_iso(instant: Arrow) -> str:
     # set to utc, make iso, remove timezone
-    instant = arrow.get(instant.astimezone(tzutc)).format('YYYYMMDDTHHmmss')
-    return instant + 'Z'
+    utc = instant.astimezone(tzutc)
+    return '%04d%02d%02dT%02d%02d%02dZ' % (
+        utc.year, utc.month, utc.day, utc.hour, utc.minute, utc.second)
 
 
 def arrow_date_to_iso(instant: Arrow) -> str:
     # date-only for all day events
     # set to utc, make iso, remove timezone
-    instant = arrow.get(instant.astimezone(tzutc)).format('YYYYMMDD')
-    return instant  # no TZ for all days
+    utc = instant.astimezone(tzutc)
+    return '%04d%02d%02d' % (utc.year, utc.month, utc.day)  # no TZ for all days
 
 
 def uid_gen() -> str:
-    uid = str(uuid4())
-    return "{}@{}.org".format(uid, uid[:4])
+    uid = uuid4().hex
+    return uid + "@" + uid[:4] + ".org"
+
+
+ESCAPE_TABLE = str.maketrans({
+    "\\": "\\\\",
+    ";": "\\;",
+    ",": "\\,",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+UNESCAPE_MAP = {
+    ";": ";",
+    ",": ",",
+    "n": "\n",
+    "N": "\n",
+    "r": "\r",
+    "R": "\r",
+    "\\": "\\",
+}
+
+UNESCAPE_RE = re.compile(r"\\([;,nNrR\\])")
 
 
 def escape_string(string: str) -> str:
-    string = string.replace("\\", "\\\\")
-    string = string.replace(";", "\\;")
-    string = string.replace(",", "\\,")
-    string = string.replace("\n", "\\n")
-    string = string.replace("\r", "\\r")
-    return string
+    return string.translate(ESCAPE_TABLE)
 
 
 def unescape_string(string: str) -> str:
-    string = string.replace("\\;", ";")
-    string = string.replace("\\,", ",")
-    string = string.replace("\\n", "\n")
-    string = string.replace("\\N", "\n")
-    string = string.replace("\\r", "\r")
-    string = string.replace("\\R", "\r")
-    string = string.replace("\\\\", "\\")
-
-    return string
+    return UNESCAPE_RE.sub(lambda match: UNESCAPE_MAP[match.group(1)], string)
@@ -2,8 +2,9 @@ import arrow
 import unittest
 
 from datetime import datetime, timedelta
-from ics.alarm import AudioAlarm, DisplayAlarm
+from ics.alarm import AlarmFactory, AudioAlarm, DisplayAlarm
 from ics.icalendar import Calendar
+from ics.parse import Container, ContentLine
 
 from .fixture import cal21, cal22, cal23, cal24, cal25
 
@@ -49,6 +50,62 @@ class TestAlarm(unittest.TestCase):
         with self.assertRaises(ValueError):
             DisplayAlarm(trigger=timedelta(minutes=15), repeat=2)
 
+    def test_alarm_hash(self):
+        a = DisplayAlarm(trigger=timedelta(minutes=15), description='plip')
+        b = DisplayAlarm(trigger=timedelta(minutes=15), description='plop')
+        c = DisplayAlarm(trigger=timedelta(minutes=20))
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(a, AudioAlarm(trigger=timedelta(minutes=15)))
+        self.assertEqual(len({a, b, c}), 2)
+
+    def test_trigger_extraction(self):
+        dataset = [
+            {},
+            {'VALUE': ['DURATION']},
+            {'RELATED': ['START']},
+        ]
+        for params in dataset:
+            c = Container('VALARM',
+                          ContentLine('TRIGGER', params, '-PT30M'),
+                          ContentLine('DESCRIPTION', value='plop'))
+            a = DisplayAlarm._from_container(c)
+            self.assertEqual(a.trigger, timedelta(minutes=30))
+
+    def test_trigger_extraction_after_start(self):
+        c = Container('VALARM',
+                      ContentLine('TRIGGER', value='PT30M'),
+                      ContentLine('DESCRIPTION', value='plop'))
+        with self.assertRaises(ValueError):
+            DisplayAlarm._from_container(c)
+
+    def test_alarm_clone(self):
+        a = DisplayAlarm(trigger=timedelta(minutes=15), description='plop')
+        b = a.clone()
+        self.assertIsInstance(b, DisplayAlarm)
+        self.assertEqual(a, b)
+        self.assertEqual(b.description, 'plop')
+        b._unused.append(ContentLine('X-PLIP'))
+        self.assertEqual(len(a._unused), 0)
+
+    def test_parsed_alarm_clone(self):
+        c = Container('VALARM',
+                      ContentLine('TRIGGER', value='-PT30M'),
+                      ContentLine('DESCRIPTION', value='plop'),
+                      ContentLine('X-PLOP', value='plip'))
+        a = DisplayAlarm._from_container(c, tz={})
+        b = a.clone()
+        self.assertEqual(a, b)
+        self.assertEqual(b._classmethod_kwargs, {'tz': {}})
+        self.assertEqual(b._unused, a._unused)
+        self.assertIsNot(b._unused, a._unused)
+
+    def test_factory_missing_action(self):
+        c = Container('VALARM', ContentLine('TRIGGER', value='-PT1H'))
+        with self.assertRaises(ValueError):
+            AlarmFactory.get_type_from_container(c)
+
     def test_alarm_timedelta_trigger_output(self):
         a = DisplayAlarm(trigger=timedelta(minutes=15))
 
@@ -1,3 +1,4 @@
+import copy
 import unittest
 from collections.abc import Iterable
 import arrow
@@ -8,7 +9,7 @@ from ics.icalendar import Calendar
 from ics.event import Event
 from ics.todo import Todo
 
-from .fixture import cal1, cal2, cal10, cal12, cal14
+from .fixture import cal1, cal2, cal10, cal12, cal14, cal21, cal33
 
 
 class TestCalendar(unittest.TestCase):
@@ -37,6 +38,47 @@ class TestCalendar(unittest.TestCase):
             # cannot compare str(c) and str(d) because times are encoded differently
             self.assertEqual(str(d), str(e))
 
+    def test_timezones(self):
+        c = Calendar(cal1)
+        self.assertEqual(list(c._timezones), ['Europe/Brussels'])
+        d = Calendar(cal1)
+        self.assertIs(c._timezones['Europe/Brussels'], d._timezones['Europe/Brussels'])
+
+    def test_custom_timezone(self):
+        c = Calendar(cal33)
+        self.assertEqual(list(c._timezones), ['W. Europe Standard Time'])
+        e = next(iter(c.events))
+        self.assertEqual(e.begin, arrow.get('2019-07-08T08:00:00Z'))
+        self.assertEqual(e.end, arrow.get('2019-07-08T09:00:00Z'))
+        # the per-parse timestamps cache is dropped once parsed
+        self.assertEqual(list(e._classmethod_kwargs), ['tz'])
+        # identical VTIMEZONE blocks are only parsed once
+        d = Calendar(cal33)
+        self.assertIs(c._timezones['W. Europe Standard Time'], d._timezones['W. Europe Standard Time'])
+
+    def test_lazy_events(self):
+        c = Calendar(cal1)
+        self.assertEqual(c.creator, '-//Apple Inc.//Mac OS X 10.9//EN')
+        self.assertIsNotNone(c._events_containers)
+
+        self.assertEqual(len(c.events), 1)
+        self.assertIsNone(c._events_containers)
+        self.assertIs(c.events, c.events)
+
+        c.events = set()
+        self.assertEqual(len(c.events), 0)
+
+    def test_lazy_events_copy(self):
+        c = Calendar(cal21)
+        d = copy.copy(c)
+        self.assertEqual(len(c.events), 1)
+        self.assertEqual(len(d.events), 1)
+        e, f = list(c.events)[0], list(d.events)[0]
+        self.assertEqual(f.name, e.name)
+        self.assertEqual(f.begin, e.begin)
+        self.assertEqual(len(f.alarms), len(e.alarms))
+        self.assertEqual(f.alarms[0].trigger, e.alarms[0].trigger)
+
     def test_repr(self):
         # TODO : more cases
         c = Calendar()
@@ -55,8 +97,9 @@ class TestCalendar(unittest.TestCase):
             c = Calendar(imports=fix)
             s = str(c)
             self.assertIsInstance(c, Iterable)
-            i_with_no_lr = map(lambda x: x.rstrip('\n'), c)
-            self.assertSequenceEqual(s.split('\n'), list(i_with_no_lr))
+            lines = list(c)
+            self.assertEqual(s + '\r\n', ''.join(lines))
+            self.assertSequenceEqual(s.split('\r\n'), [x[:-2] for x in lines])
 
     def test_eq(self):
         # TODO : better equality check
@@ -192,6 +235,10 @@ class TestCalendar(unittest.TestCase):
         self.assertEqual(c0.todos, c1.todos)
         self.assertEqual(c0, c1)
 
+        c1.events.add(Event())
+        self.assertEqual(len(c0.events), 1)
+        self.assertIs(c1.timeline._calendar, c1)
+
     def test_multiple_calendars(self):
 
         with self.assertRaises(TypeError):
@@ -32,6 +32,20 @@ class TestComponent(unittest.TestCase):
         expected = fix1
         self.assertEqual(str(c), expected)
 
+    def test_inherited(self):
+        c = CT5()
+        c.some_attr = "foo"
+        c.some_attr2 = "bar"
+        self.assertEqual(str(c), fix2)
+
+        cont = Container("TEST")
+        cont.append(ContentLine(name="ATTR", value="plip"))
+        cont.append(ContentLine(name="ATTR2", value="plop"))
+        c = CT5._from_container(cont)
+        self.assertEqual(c.some_attr, "plip")
+        self.assertEqual(c.some_attr2, "plop")
+        self.assertEqual(Container("TEST"), c._unused)
+
     def test_2extractors(self):
         c = CT2()
         c.some_attr = "foo"
@@ -131,6 +145,14 @@ class TestComponent(unittest.TestCase):
         self.assertEqual(c.some_attr, "anything")
         self.assertEqual(Container("TEST"), c._unused)
 
+    def test_missing_required(self):
+        cont = Container("TEST")
+        cont.append(ContentLine(name="OTHER", value="anything"))
+
+        with self.assertRaises(ValueError) as context:
+            CT6._from_container(cont)
+        self.assertIn('ATTR, ATTR2', str(context.exception))
+
     def test_multiple_unique_required(self):
         cont = Container("TEST")
         cont.append(ContentLine(name="OTHER", value="anything"))
@@ -164,6 +186,14 @@ class CT4(ComponentBaseTest):
     _OUTPUTS, _EXTRACTORS = [], []
 
 
+class CT5(CT1):
+    _OUTPUTS, _EXTRACTORS = [], []
+
+
+class CT6(ComponentBaseTest):
+    _OUTPUTS, _EXTRACTORS = [], []
+
+
 @CT1._extracts('ATTR')
 def attr1(test, line):
     if line:
@@ -202,3 +232,25 @@ def o_some_attr2(test, container):
 def o_some_attr2bis(test, container):
     if test.some_attr2:
         container.append(ContentLine('ATTR2', value=test.some_attr2.upper()))
+
+
+@CT5._extracts('ATTR2')
+def attr5(test, line):
+    if line:
+        test.some_attr2 = line.value
+
+
+@CT5._outputs
+def o_some_attr5(test, container):
+    if test.some_attr2:
+        container.append(ContentLine('ATTR2', value=test.some_attr2.upper()))
+
+
+@CT6._extracts('ATTR', required=True)
+def attr6(test, line):
+    test.some_attr = line.value
+
+
+@CT6._extracts('ATTR2', required=True)
+def attr6bis(test, line):
+    test.some_attr2 = line.value
@@ -69,3 +69,16 @@ class TestContentLine(unittest.TestCase):
         line = ContentLine.parse("DTSTART;TZID=Europe/Berlin:20151104T190000")
         arrow = iso_to_arrow(line)
         self.assertIn("Europe/Berlin", str(arrow.tzinfo))
+
+    def test_interned(self):
+        line1 = ContentLine.parse("DTSTART;TZID=Europe/Berlin:20151104T190000")
+        line2 = ContentLine.parse("dtstart;TZID=Europe/Berlin:20151105T190000")
+        self.assertIs(line1.name, line2.name)
+        self.assertIs(line1.params['TZID'][0], line2.params['TZID'][0])
+
+    def test_free_form_params_not_interned(self):
+        line1 = ContentLine.parse("ATTENDEE;CN=John Doe:mailto:john@example.com")
+        line2 = ContentLine.parse("ATTENDEE;CN=John Doe:mailto:john@example.com")
+        self.assertIs(next(iter(line1.params)), next(iter(line2.params)))
+        self.assertEqual(line1.params['CN'], line2.params['CN'])
+        self.assertIsNot(line1.params['CN'][0], line2.params['CN'][0])
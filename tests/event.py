@@ -34,8 +34,9 @@ class TestEvent(unittest.TestCase):
         self.assertEqual(e.end - e.begin, td(1, 3600))
 
     def test_not_duration_and_end(self):
+        c = Calendar(cal13)
         with self.assertRaises(ValueError):
-            Calendar(cal13)
+            c.events
 
     def test_duration_output(self):
         e = Event(begin=0, duration=td(1, 23))
@@ -164,6 +165,10 @@ class TestEvent(unittest.TestCase):
         line = str(a2)
         self.assertIn("ATTENDEE;CN='Email':mailto:email@email.com", line)
 
+        a3 = Attendee(email='email@email.com', common_name='Email', rsvp=True)
+        line = str(a3)
+        self.assertIn("ATTENDEE;CN='Email';RSVP=TRUE:mailto:email@email.com", line)
+
     def test_add_attendees(self):
         e = Event()
         a = Attendee(email='email@email.com')
@@ -182,6 +187,10 @@ class TestEvent(unittest.TestCase):
         e.uid = None
         self.assertIn('UID:', str(e))
 
+    def test_hash(self):
+        self.assertEqual(hash(Event(uid='plop')), hash(Event(uid='plop')))
+        self.assertNotEqual(hash(Event(uid='plop')), hash(Event(uid='plip')))
+
     def test_cmp_other(self):
         with self.assertRaises(NotImplementedError):
             Event() < 1
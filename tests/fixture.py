@@ -503,6 +503,34 @@ END:VEVENT
 END:VCALENDAR
 """
 
+cal33 = """
+BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Microsoft Corporation//Outlook 16.0 MIMEDIR//EN
+BEGIN:VTIMEZONE
+TZID:W. Europe Standard Time
+BEGIN:STANDARD
+DTSTART:16010101T030000
+TZOFFSETFROM:+0200
+TZOFFSETTO:+0100
+RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=10
+END:STANDARD
+BEGIN:DAYLIGHT
+DTSTART:16010101T020000
+TZOFFSETFROM:+0100
+TZOFFSETTO:+0200
+RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=3
+END:DAYLIGHT
+END:VTIMEZONE
+BEGIN:VEVENT
+UID:040000008200E00074C5B7101A82E00800000000
+DTSTART;TZID=W. Europe Standard Time:20190708T100000
+DTEND;TZID=W. Europe Standard Time:20190708T110000
+SUMMARY:Outlook event
+END:VEVENT
+END:VCALENDAR
+"""
+
 clas33 = """
 BEGIN:VTIMEZONE
 TZID:Australia/Sydney
@@ -68,6 +68,19 @@ class TestContainer(unittest.TestCase):
 
         self.assertEqual("<Container 'test' with 1 element>", repr(c))
 
+    def test_partition(self):
+        a = ContentLine(name="A", value="1")
+        b = ContentLine(name="B", value="2")
+        a2 = ContentLine(name="A", value="3")
+        d = ContentLine(name="D", value="4")
+        c = Container("test", a, b, a2, d)
+
+        index, rest = c._partition({'A', 'C'})
+        self.assertEqual([a, a2], index['A'])
+        self.assertEqual([], index['C'])
+        self.assertNotIn('B', index)
+        self.assertEqual([b, d], rest)
+
 
 class TestLine(unittest.TestCase):
 
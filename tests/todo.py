@@ -1,10 +1,11 @@
 import unittest
+import weakref
 import arrow
 from datetime import datetime, timedelta
 
 from datetime import timezone
 
-from ics.parse import Container
+from ics.parse import Container, ContentLine
 from ics.alarm import AlarmFactory
 from ics.icalendar import Calendar
 from .fixture import cal27, cal28, cal29, cal30, cal31
@@ -22,6 +23,7 @@ class TestTodo(unittest.TestCase):
         t = Todo()
         self.assertIsNotNone(t.uid)
         self.assertIsNotNone(t.dtstamp)
+        self.assertEqual(t.dtstamp.utcoffset(), timedelta(0))
         self.assertIsNone(t.completed)
         self.assertIsNone(t.created)
         self.assertIsNone(t.description)
@@ -120,6 +122,15 @@ class TestTodo(unittest.TestCase):
         t2 = Todo(begin=begin, duration=1)
         self.assertEqual(t2.due, begin + timedelta(1))
 
+        # The computed due follows begin and duration changes
+        t2.begin = begin + timedelta(1)
+        self.assertEqual(t2.due, begin + timedelta(2))
+        t2.duration = timedelta(hours=1)
+        self.assertEqual(t2.due, begin + timedelta(days=1, hours=1))
+        t2.due = begin + timedelta(3)
+        self.assertEqual(t2.due, begin + timedelta(3))
+        self.assertEqual(t2.duration, timedelta(2))
+
     def test_invalid_time_attributes(self):
         # due and duration must not be set at the same time
         with self.assertRaises(ValueError):
@@ -129,6 +140,14 @@ class TestTodo(unittest.TestCase):
         with self.assertRaises(ValueError):
             Todo(duration=1)
 
+    def test_status(self):
+        t = Todo(status='completed')
+        self.assertEqual(t.status, 'COMPLETED')
+        t.status = None
+        self.assertIsNone(t.status)
+        with self.assertRaises(ValueError):
+            t.status = 'DONE'
+
     def test_repr(self):
         begin = datetime(2018, 2, 18, 12, 19, tzinfo=utc)
 
@@ -265,8 +284,8 @@ class TestTodo(unittest.TestCase):
 
         # Check comparison by name
         self.assertTrue(t1 >= t1)
-        self.assertTrue(t1 >= t2)
-        self.assertFalse(t2 >= t1)
+        self.assertFalse(t1 >= t2)
+        self.assertTrue(t2 >= t1)
         self.assertFalse(t2 >= t3)
         self.assertTrue(t2 >= t2)
         self.assertTrue(t3 >= t2)
@@ -289,6 +308,13 @@ class TestTodo(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             t2 >= 1
 
+    def test_todo_sorted(self):
+        t1 = Todo()
+        t2 = Todo(name='a')
+        t3 = Todo(name='b')
+        self.assertEqual(sorted([t3, t1, t2]), [t1, t2, t3])
+        self.assertEqual(sorted([t2, t3, t1], reverse=True), [t3, t2, t1])
+
     def test_todo_eq(self):
         t1 = Todo()
         t2 = Todo()
@@ -309,6 +335,35 @@ class TestTodo(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             t1 != 1
 
+    def test_todo_hash(self):
+        self.assertEqual(hash(Todo(uid='plop')), hash(Todo(uid='plop')))
+        self.assertNotEqual(hash(Todo(uid='plop')), hash(Todo(uid='plip')))
+        self.assertEqual(len({Todo(uid='plop'), Todo(uid='plop')}), 1)
+
+    def test_clone(self):
+        t = Todo(name='plop', begin=datetime(2018, 2, 18, 12, 19), alarms=[])
+        t._unused.append(ContentLine('X-PLOP', value='plop'))
+        c = t.clone()
+        self.assertEqual(c, t)
+        self.assertEqual(c.name, 'plop')
+        self.assertEqual(c.begin, t.begin)
+        self.assertIsNot(c.alarms, t.alarms)
+        self.assertIsNot(c._unused, t._unused)
+        self.assertEqual(str(c), str(t))
+
+    def test_clone_parsed(self):
+        t = Calendar(cal27).todos.pop()
+        c = t.clone()
+        self.assertEqual(c._classmethod_kwargs, t._classmethod_kwargs)
+        self.assertEqual(str(c), str(t))
+
+    def test_slots(self):
+        t = Todo()
+        self.assertFalse(hasattr(t, '__dict__'))
+        with self.assertRaises(AttributeError):
+            t.plop = 'plip'
+        self.assertIs(weakref.ref(t)(), t)
+
     def test_extract(self):
         c = Calendar(cal27)
         t = next(iter(c.todos))
@@ -332,12 +387,14 @@ class TestTodo(unittest.TestCase):
         self.assertEqual(t.due, arrow.get('2018-02-18T16:48:00Z'))
 
     def test_extract_due_error_duration(self):
+        c = Calendar(cal29)
         with self.assertRaises(ValueError):
-            Calendar(cal29)
+            c.todos
 
     def test_extract_duration_error_due(self):
+        c = Calendar(cal30)
         with self.assertRaises(ValueError):
-            Calendar(cal30)
+            c.todos
 
     def test_output(self):
         c = Calendar(cal27)
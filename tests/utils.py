@@ -1,7 +1,11 @@
 import unittest
 from datetime import timedelta
-from ics.parse import ParseError, Container, string_to_container
-from ics.utils import parse_duration, timedelta_to_duration, remove_x, iso_to_arrow
+from ics.parse import ParseError, Container, ContentLine, string_to_container
+import arrow
+from dateutil import tz
+from ics.utils import parse_duration, timedelta_to_duration, remove_x, iso_to_arrow, arrow_get
+from ics.utils import escape_string, unescape_string, arrow_to_iso, arrow_date_to_iso
+from ics.utils import cached_gettz, get_lines, remove_sequence, uid_gen, get_arrow
 
 from tests.fixture import cal1, cal2
 
@@ -20,6 +24,11 @@ class TestParseDuration(unittest.TestCase):
         "PT1S1M": (0, 61)
     }
 
+    dataset_rfc = {
+        "P15DT5H0M20S": (15, 18020), "P2W": (14, 0), "+PT1H30M": (0, 5400),
+        "-P1WT2S": (-7, -2), "P": (0, 0),
+    }
+
     def run_on_dataset(self, dataset):
         for test in dataset:
             expected = dataset[test]
@@ -31,6 +40,9 @@ class TestParseDuration(unittest.TestCase):
     def test_combined(self):
         self.run_on_dataset(self.dataset_combined)
 
+    def test_rfc(self):
+        self.run_on_dataset(self.dataset_rfc)
+
     def test_no_p(self):
         self.assertRaises(ParseError, parse_duration, 'caca')
 
@@ -40,6 +52,23 @@ class TestParseDuration(unittest.TestCase):
     def test_two_occurences(self):
         self.assertRaises(ParseError, parse_duration, 'P1D1D')
 
+    def test_no_unit(self):
+        self.assertRaises(ParseError, parse_duration, 'P1')
+        self.assertRaises(ParseError, parse_duration, 'PT15')
+
+    def test_trailing_newline(self):
+        self.assertRaises(ParseError, parse_duration, 'P1D\n')
+        self.assertRaises(ParseError, parse_duration, 'PT1H\n')
+
+    def test_cached(self):
+        first = parse_duration('-PT15M')
+        hits = parse_duration.cache_info().hits
+        self.assertIs(parse_duration('-PT15M'), first)
+        self.assertEqual(parse_duration.cache_info().hits, hits + 1)
+        # errors are raised every time, not cached
+        self.assertRaises(ParseError, parse_duration, 'P1')
+        self.assertRaises(ParseError, parse_duration, 'P1')
+
 
 class TestTimedeltaToDuration(unittest.TestCase):
     dataset_simple = {
@@ -52,6 +81,10 @@ class TestTimedeltaToDuration(unittest.TestCase):
         (1, 1): 'P1DT1S', (8, 3661): 'P1W1DT1H1M1S', (15, 18020): 'P2W1DT5H20S',
     }
 
+    dataset_negative = {
+        (0, -900): '-PT15M', (-8, -3661): '-P1W1DT1H1M1S',
+    }
+
     def run_on_dataset(self, dataset):
         for test in dataset:
             expected = dataset[test]
@@ -63,6 +96,11 @@ class TestTimedeltaToDuration(unittest.TestCase):
     def test_combined(self):
         self.run_on_dataset(self.dataset_combined)
 
+    def test_negative(self):
+        self.run_on_dataset(self.dataset_negative)
+        for test in self.dataset_negative:
+            self.assertEqual(parse_duration(timedelta_to_duration(timedelta(*test))), timedelta(*test))
+
 
 class TestRemoveX(unittest.TestCase):
 
@@ -79,7 +117,160 @@ class TestRemoveX(unittest.TestCase):
         self.assertSequenceEqual(c, c2)
 
 
+class TestRemoveSequence(unittest.TestCase):
+
+    def test_remove(self):
+        c = Container('TEST', ContentLine('SEQUENCE', value='1'),
+                      ContentLine('TZID', value='a'), ContentLine('SEQUENCE', value='2'))
+        remove_sequence(c)
+        self.assertEqual(c, Container('TEST', ContentLine('TZID', value='a')))
+
+
+class TestGetLines(unittest.TestCase):
+
+    def test_get_lines(self):
+        a1 = ContentLine('A', value='1')
+        b = ContentLine('B', value='2')
+        a2 = ContentLine('A', value='3')
+        c = Container('TEST', a1, b, a2)
+        self.assertEqual(get_lines(c, 'A'), [a2, a1])
+        self.assertEqual(c, Container('TEST', b))
+        self.assertEqual(get_lines(c, 'C'), [])
+
+
+class TestGetArrow(unittest.TestCase):
+
+    def test_get_arrow(self):
+        instant = arrow.get(2013, 1, 2, 3, 4, 5)
+        self.assertIsNone(get_arrow(None))
+        self.assertIs(get_arrow(instant), instant)
+        self.assertEqual(get_arrow((2013, 1, 2, 3, 4, 5)), instant)
+        self.assertEqual(get_arrow({'tzinfo': 'UTC'}).tzinfo, tz.tzutc())
+        self.assertEqual(get_arrow('2013-01-02T03:04:05+00:00'), instant)
+
+    def test_arrow_subclass(self):
+        class MyArrow(arrow.Arrow):
+            pass
+        instant = MyArrow(2013, 1, 2)
+        self.assertIs(get_arrow(instant), instant)
+
+
+class TestArrowToIso(unittest.TestCase):
+
+    def test_utc(self):
+        instant = arrow.get(2013, 1, 2, 3, 4, 5)
+        self.assertEqual(arrow_to_iso(instant), '20130102T030405Z')
+        self.assertEqual(arrow_date_to_iso(instant), '20130102')
+
+    def test_local(self):
+        instant = arrow.get(2013, 1, 1, 0, 30).replace(tzinfo='+01:00')
+        self.assertEqual(arrow_to_iso(instant), '20121231T233000Z')
+        self.assertEqual(arrow_date_to_iso(instant), '20121231')
+
+    def test_padding(self):
+        instant = arrow.get(999, 1, 2)
+        self.assertEqual(arrow_to_iso(instant), '09990102T000000Z')
+        self.assertEqual(arrow_date_to_iso(instant), '09990102')
+
+
+class TestUidGen(unittest.TestCase):
+
+    def test_uid_gen(self):
+        uid = uid_gen()
+        self.assertRegex(uid, '^[0-9a-f]{32}@[0-9a-f]{4}\\.org$')
+        self.assertEqual(uid[:4], uid[33:37])
+        self.assertNotEqual(uid, uid_gen())
+
+
+class TestEscape(unittest.TestCase):
+
+    def test_escape(self):
+        self.assertEqual(escape_string('a\\b;c,d\ne\rf'), 'a\\\\b\\;c\\,d\\ne\\rf')
+
+    def test_unescape(self):
+        self.assertEqual(unescape_string('a\\\\b\\;c\\,d\\ne\\Nf\\rg\\Rh\\x'), 'a\\b;c,d\ne\nf\rg\rh\\x')
+
+    def test_round_trip(self):
+        string = 'C:\\new\\folder; nothing,\nhere'
+        self.assertEqual(unescape_string(escape_string(string)), string)
+
+
+class TestCachedGettz(unittest.TestCase):
+
+    def test_known(self):
+        self.assertIs(cached_gettz('Europe/Berlin'), cached_gettz('Europe/Berlin'))
+        self.assertEqual(cached_gettz('Europe/Berlin'), tz.gettz('Europe/Berlin'))
+
+    def test_unknown(self):
+        self.assertIsNone(cached_gettz('W. Europe Standard Time'))
+        self.assertIsNone(cached_gettz('W. Europe Standard Time'))
+
+
 class TestIso_to_arrow(unittest.TestCase):
 
     def test_none(self):
         self.assertIs(None, iso_to_arrow(None))
+
+    def test_system_tz(self):
+        line = ContentLine('DTSTART', {'TZID': ['Europe/Berlin']}, '20130101T102030')
+        expected = arrow.get(2013, 1, 1, 9, 20, 30)
+        self.assertEqual(iso_to_arrow(line), expected)
+        self.assertEqual(iso_to_arrow(line), expected)
+
+    def test_system_tz_not_aliased(self):
+        line = ContentLine('DTSTART', {'TZID': ['Europe/Berlin']}, '20130101T102030')
+        first = iso_to_arrow(line)
+        first.tzinfo = tz.gettz('Asia/Tokyo')
+        self.assertIsNot(iso_to_arrow(line), first)
+        self.assertEqual(iso_to_arrow(line), arrow.get(2013, 1, 1, 9, 20, 30))
+
+    def test_calendar_tz_not_shared(self):
+        line = ContentLine('DTSTART', {'TZID': ['Custom Zone']}, '20130101T102030')
+        plus_one = {'Custom Zone': tz.tzoffset(None, 3600)}
+        plus_two = {'Custom Zone': tz.tzoffset(None, 7200)}
+        self.assertEqual(iso_to_arrow(line, plus_one), arrow.get(2013, 1, 1, 9, 20, 30))
+        self.assertEqual(iso_to_arrow(line, plus_two), arrow.get(2013, 1, 1, 8, 20, 30))
+
+    def test_calendar_tz_cache(self):
+        line = ContentLine('DTSTART', {'TZID': ['Custom Zone']}, '20130101T102030')
+        plus_one = {'Custom Zone': tz.tzoffset(None, 3600)}
+        cache = {}
+        first = iso_to_arrow(line, plus_one, cache)
+        self.assertEqual(first, arrow.get(2013, 1, 1, 9, 20, 30))
+        self.assertEqual(cache, {('20130101T102030', 'Custom Zone'): first.datetime})
+        # every line gets its own Arrow
+        first.tzinfo = tz.gettz('Asia/Tokyo')
+        second = iso_to_arrow(line, plus_one, cache)
+        self.assertIsNot(second, first)
+        self.assertEqual(second, arrow.get(2013, 1, 1, 9, 20, 30))
+
+
+class TestArrowGet(unittest.TestCase):
+    dataset = {
+        '20130101': arrow.get(2013, 1, 1),
+        '201301': arrow.get(2013, 1, 1),
+        '20130101T10': arrow.get(2013, 1, 1, 10),
+        '20130101T1020': arrow.get(2013, 1, 1, 10, 20),
+        '20130101T102030': arrow.get(2013, 1, 1, 10, 20, 30),
+        '20130101T102030Z': arrow.get(2013, 1, 1, 10, 20, 30),
+        '2013-01-01T10:20:30+01:00': arrow.get(2013, 1, 1, 9, 20, 30),
+        '2013/01/01': arrow.get(2013, 1, 1),
+    }
+
+    def test_formats(self):
+        for string, expected in self.dataset.items():
+            self.assertEqual(arrow_get(string), expected)
+
+    def test_not_aliased(self):
+        first = arrow_get('20130101T102030')
+        first.tzinfo = tz.gettz('Asia/Tokyo')
+        self.assertIsNot(arrow_get('20130101T102030'), first)
+        self.assertEqual(arrow_get('20130101T102030'), arrow.get(2013, 1, 1, 10, 20, 30))
+
+    def test_invalid(self):
+        with self.assertRaises(Exception):
+            arrow_get('20131301')
+        with self.assertRaises(Exception):
+            arrow_get('2013010')
+        with self.assertRaises(Exception):
+            arrow_get('20130101\n')